@@ -4,15 +4,226 @@ Detects circular logic, missing validation, and other methodological issues in r
 """
 
 import ast
+import hashlib
+import io
+import json
+import mmap
+import os
 import re
+import tokenize
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Tuple, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from pathlib import Path
 
+try:
+    import hyperscan  # SIMD multi-pattern matcher (optional)
+except ImportError:
+    hyperscan = None
 
-@dataclass
+
+# All patterns are compiled once at import time. audit_file runs them on every
+# line of every file, so relying on re's internal cache (capped, dict lookup per
+# call) is measurably slower on large repos. Case-insensitive patterns carry
+# re.IGNORECASE instead of lowercasing each line (avoids a copy per line).
+
+# Combined def scan for the regex fallback path: finds validation defs and
+# measurement defs in the same pass. A def line mentioning validation can
+# only match vdef, but in that case the file has validation keywords anyway
+# so the missing-validation branch would not fire for it.
+_RE_DEF_SCAN = re.compile(
+    rb'(?i:(?P<vdef>def.*(?:validate|validation|verify)))'
+    rb'|(?P<mdef>def\s+(?:measure|detect|score|evaluate)\s*\()'
+)
+
+# Inline patterns used by the individual checks
+_RE_CIRCULAR_CALL = re.compile(rb'self\.(detect|measure|score)')
+_RE_PATTERN_WORD = re.compile(rb'pattern', re.IGNORECASE)
+_RE_EFFECT_SIZE = re.compile(rb'(cohen|effect.size|confidence.interval)', re.IGNORECASE)
+_RE_NEWLINE = re.compile(rb'\n')
+
+# Combined alternation for the statistical and reproducibility checks. One
+# finditer pass over the whole file replaces several re.search calls per line;
+# the regex engine scans in C and we only come back to Python on actual hits.
+# The hyperparameter group stays case-sensitive to match the original check.
+_RE_SCAN = re.compile(
+    rb'(?i:(?P<pval>p\s*[<>=])'
+    rb'|(?P<sig>significant))'
+    rb'|(?P<hyper>(?:threshold|alpha|beta|learning_rate)\s*=\s*[0-9.]+)'
+)
+
+# When hyperscan is available, the same pattern set is compiled once into a
+# single database and each file is streamed through it in one SIMD-accelerated
+# pass. Pattern ids index into _SCAN_GROUPS so both backends speak the same
+# group names.
+_SCAN_GROUPS = ('pval', 'sig', 'hyper')
+
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[
+            rb'p\s*[<>=]',
+            rb'significant',
+            rb'(threshold|alpha|beta|learning_rate)\s*=\s*[0-9.]+',
+        ],
+        ids=[0, 1, 2],
+        flags=[
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST,
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST,
+            hyperscan.HS_FLAG_SOM_LEFTMOST,  # hyperparameter names stay case-sensitive
+        ],
+    )
+else:
+    _HS_DB = None
+
+
+def _scan_matches(content):
+    """Yield (group, start_offset) hits for the statistical/repro scan.
+
+    Uses the hyperscan database when installed, the combined re
+    alternation otherwise. Hits are yielded in offset order either way,
+    which the per-line dedup in the caller relies on.
+    """
+    if _HS_DB is not None:
+        hits = []
+
+        def on_match(pat_id, start, end, flags, ctx):
+            hits.append((start, pat_id))
+
+        data = content if isinstance(content, bytes) else content[:]
+        _HS_DB.scan(data, match_event_handler=on_match)
+        hits.sort()
+        for start, pat_id in hits:
+            yield _SCAN_GROUPS[pat_id], start
+    else:
+        for match in _RE_SCAN.finditer(content):
+            yield match.lastgroup, match.start()
+
+# Literal keywords whose mere presence in a file decides whether whole checks
+# need to run at all: the validation group gates the circular/missing-
+# validation checks, random/seed feed the reproducibility check. One combined
+# alternation scans the mapped bytes in a single C-level pass with no decode
+# or lowercase copy. Seed names come before random ones so random_state is
+# not consumed by 'random'.
+_RE_KEYWORDS = re.compile(
+    rb'(?P<validation>validate|validation|verify|ground[ _-]truth)'
+    rb'|(?P<seed>seed|random_state)'
+    rb'|(?P<random>random|shuffle|sample|choice)',
+    re.IGNORECASE
+)
+_N_KEYWORD_GROUPS = _RE_KEYWORDS.groups
+# str twin of the pattern-word test, used on (possibly large) docstring
+# constants during the AST walk
+_RE_PATTERN_WORD_STR = re.compile(r'pattern', re.IGNORECASE)
+
+
+def _keyword_tags(content) -> Set[str]:
+    """Tags of literal keywords present in the file (single scan)."""
+    tags = set()
+    for match in _RE_KEYWORDS.finditer(content):
+        tags.add(match.lastgroup)
+        if len(tags) == _N_KEYWORD_GROUPS:  # every tag already seen; stop scanning
+            break
+    return tags
+
+
+# Directories that never contain the user's research code; descending into
+# them (especially .git and virtualenvs) can cost more stat calls than the
+# audit itself on large repos
+_SKIP_DIRS = {
+    '.git', '.hg', '.svn', '__pycache__',
+    '.venv', 'venv', 'env', 'node_modules',
+    '.tox', '.mypy_cache', '.pytest_cache',
+}
+
+
+def _walk_py_files(root: str):
+    """Yield paths of .py files under root, pruning _SKIP_DIRS.
+
+    Manual os.scandir walk instead of Path.rglob: DirEntry caches the
+    d_type from the directory listing, so classifying entries needs no
+    extra stat calls, and skipped trees are never entered at all.
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+
+# Cache of audit results keyed by file content hash, so re-runs (CI, watch
+# mode) only re-audit files that actually changed
+_CACHE_FILENAME = '.methodology_cache.json'
+
+
+def _load_audit_cache(cache_path: Path) -> Dict[str, list]:
+    """Load the content-hash cache, tolerating a missing/corrupt file"""
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _content_digest(content_bytes: bytes) -> str:
+    # blake2b: faster than SHA-256 and nothing here needs crypto strength
+    return hashlib.blake2b(content_bytes, digest_size=16).hexdigest()
+
+
+def _candidate_def_lines(content) -> 'Set[int] | None':
+    """Line numbers containing a `def` keyword, from the C tokenizer.
+
+    Two-stage prefilter for the regex fallback: the tokenizer enumerates
+    NAME tokens far faster than running the def regex over every line,
+    so the regex only has to confirm candidates. Returns None when the
+    file cannot be tokenized either (then the caller scans everything,
+    since a partial token stream could miss defs after the error).
+    """
+    def_lines = set()
+    try:
+        for tok in tokenize.tokenize(io.BytesIO(content[:]).readline):
+            if tok.type == tokenize.NAME and tok.string == 'def':
+                def_lines.add(tok.start[0])
+    except (tokenize.TokenError, SyntaxError, UnicodeDecodeError):
+        return None
+    return def_lines
+
+
+def _line_starts(content) -> List[int]:
+    """Offsets at which each line begins, plus a sentinel past the end.
+
+    With the sentinel, line i (1-based) is content[starts[i-1]:starts[i]-1]
+    and the line number of a match is bisect_right(starts, match.start()).
+    """
+    starts = [0]
+    starts.extend(m.end() for m in _RE_NEWLINE.finditer(content))
+    starts.append(len(content) + 1)
+    return starts
+
+
+@dataclass(slots=True, frozen=True)
 class MethodologyIssue:
-    """Represents a methodological issue found in code"""
+    """Represents a methodological issue found in code.
+
+    Slotted and frozen: large repos produce thousands of instances, and
+    dropping the per-instance __dict__ cuts memory several-fold.
+    """
     severity: str  # 'critical', 'major', 'minor'
     category: str  # 'circular_logic', 'missing_validation', etc.
     description: str
@@ -30,90 +241,177 @@ class MethodologyAuditor:
     
     def __init__(self):
         self.issues: List[MethodologyIssue] = []
-        
-        # Patterns indicating circular validation
-        self.circular_patterns = [
-            (r'def.*validate.*\(', r'self\..*\('),  # validate method calling same class methods
-            (r'pattern.*match', r'validate.*pattern'),  # pattern matching validating patterns
-            (r'model\.predict', r'validate.*model'),  # model validating itself
-            (r'confidence', r'validate.*confidence'),  # confidence validating confidence
-        ]
-        
-        # Patterns indicating missing validation
-        self.missing_validation_patterns = [
-            r'def\s+measure\s*\(',
-            r'def\s+detect\s*\(',
-            r'def\s+score\s*\(',
-            r'def\s+evaluate\s*\(',
-        ]
-        
-        # Patterns indicating statistical issues
-        self.statistical_red_flags = [
-            (r'p\s*<\s*0\.05', 'p-value without effect size'),
-            (r'significant', 'significance claim without details'),
-            (r'\.mean\(\)', 'mean without standard deviation/CI'),
-        ]
+        self.severity_counts: Counter = Counter()
     
     def audit_file(self, filepath: str) -> List[MethodologyIssue]:
         """Audit a single Python file"""
         self.issues = []
         
         try:
-            with open(filepath, 'r') as f:
-                content = f.read()
-            
-            # Check for circular validation
-            self._check_circular_validation(content, filepath)
-            
-            # Check for missing validation
-            self._check_missing_validation(content, filepath)
-            
-            # Check for statistical issues
-            self._check_statistical_issues(content, filepath)
-            
-            # Check for reproducibility issues
-            self._check_reproducibility(content, filepath)
-            
-            # Parse AST for deeper analysis
+            # Map the file instead of read()+decode: the bytes patterns scan
+            # the mapping directly, so no str copy (or lowercased copy) of
+            # the file is ever built
+            with open(filepath, 'rb') as f:
+                try:
+                    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    content = f.read()  # zero-length files cannot be mapped
+
             try:
-                tree = ast.parse(content)
-                self._check_ast(tree, filepath)
-            except SyntaxError:
-                pass  # Skip files with syntax errors
-            
+                # One keyword scan decides which checks need to run at all
+                tags = _keyword_tags(content)
+                has_validation = 'validation' in tags
+
+                # Parse once; the structural checks (circular logic, missing
+                # validation) all run off this tree instead of re-scanning
+                # the text line by line. ast.parse accepts bytes directly.
+                try:
+                    tree = ast.parse(content[:])
+                except SyntaxError:
+                    tree = None
+
+                # One line-offset table serves every text-based check
+                starts = _line_starts(content)
+
+                if tree is not None:
+                    self._check_tree(tree, filepath, has_validation)
+                else:
+                    # Regex heuristics remain as a fallback for files that
+                    # do not parse
+                    self._scan_fallback(content, starts, filepath, has_validation)
+
+                # Statistical and reproducibility checks stay text-based
+                # (comments and strings matter there)
+                self._check_statistics_and_reproducibility(content, starts, filepath, tags)
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+
         except Exception as e:
             print(f"Error auditing {filepath}: {e}")
         
         return self.issues
     
-    def audit_directory(self, dirpath: str) -> Dict[str, List[MethodologyIssue]]:
-        """Audit all Python files in a directory"""
+    def audit_directory(self, dirpath: str, max_workers: int = None,
+                        use_cache: bool = True) -> Dict[str, List[MethodologyIssue]]:
+        """Audit all Python files in a directory.
+
+        Files are independent and the work is CPU-bound (regex + AST
+        parsing), so they are sharded across worker processes. Small
+        batches are audited serially to avoid the pool startup cost.
+
+        Results are cached in .methodology_cache.json at the directory
+        root, keyed by relative path plus content hash (issue locations
+        embed the path, so identical files must not share an entry);
+        unchanged files are not re-audited on re-runs.
+        """
         results = {}
-        
-        for filepath in Path(dirpath).rglob("*.py"):
-            issues = self.audit_file(str(filepath))
+        paths = list(_walk_py_files(dirpath))
+
+        cache_path = Path(dirpath) / _CACHE_FILENAME
+        cache = _load_audit_cache(cache_path) if use_cache else {}
+        new_cache = {}
+        # Severity tallies accumulate as results arrive, so the summary
+        # never needs extra passes over the full issue list
+        counts = Counter()
+
+        # Hash first: cache hits skip the audit entirely
+        cache_keys = {}
+        to_audit = []
+        for filepath in paths:
+            try:
+                digest = _content_digest(Path(filepath).read_bytes())
+            except OSError:
+                continue
+            key = f'{os.path.relpath(filepath, dirpath)}:{digest}'
+            cache_keys[filepath] = key
+            if key in cache:
+                new_cache[key] = cache[key]
+                issues = [MethodologyIssue(**entry) for entry in cache[key]]
+                if issues:
+                    results[filepath] = issues
+                    counts.update(issue.severity for issue in issues)
+            else:
+                to_audit.append(filepath)
+
+        if len(to_audit) < 4:
+            audited = ((filepath, audit_file_cached(filepath)) for filepath in to_audit)
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            audited = executor.map(_audit_one, to_audit, chunksize=16)
+
+        for filepath, issues in audited:
+            new_cache[cache_keys[filepath]] = [asdict(issue) for issue in issues]
             if issues:
-                results[str(filepath)] = issues
-        
+                results[filepath] = issues
+                counts.update(issue.severity for issue in issues)
+
+        if len(to_audit) >= 4:
+            executor.shutdown()
+
+        if use_cache:
+            try:
+                with open(cache_path, 'w') as f:
+                    json.dump(new_cache, f)
+            except OSError:
+                pass  # Caching is best-effort; the audit itself succeeded
+
+        # Keep the full issue list so generate_report covers every file,
+        # not just the last one audited
+        self.issues = [issue for issues in results.values() for issue in issues]
+        self.severity_counts = counts
+
         return results
     
-    def _check_circular_validation(self, content: str, filepath: str):
-        """Check for circular validation patterns"""
-        lines = content.split('\n')
-        
-        # Look for validation methods
-        validation_methods = []
-        for i, line in enumerate(lines, 1):
-            if re.search(r'def.*(validate|validation|verify)', line.lower()):
-                validation_methods.append((i, line))
-        
-        # Check if validation uses same methods as measurement
-        for line_num, line in validation_methods:
-            # Get the method body (simplified - just look at nearby lines)
-            method_body = '\n'.join(lines[line_num:min(line_num+20, len(lines))])
-            
+    def _scan_fallback(self, content: bytes, starts: List[int], filepath: str,
+                       has_validation: bool):
+        """Regex fallback for files that do not parse.
+
+        One combined scan finds validation defs (circular-logic check) and
+        measurement defs (missing-validation check) in a single pass.
+        """
+        n_lines = len(starts) - 1
+        last_line = 0
+
+        # Files reach this path because ast.parse failed, but many still
+        # tokenize (legacy syntax, for instance). When they do, the def
+        # regex only has to confirm tokenizer-identified candidate lines
+        # instead of scanning the whole file.
+        def_lines = _candidate_def_lines(content)
+        if def_lines is None:
+            matches = list(_RE_DEF_SCAN.finditer(content))
+        else:
+            matches = []
+            for candidate in sorted(def_lines):
+                match = _RE_DEF_SCAN.search(content, starts[candidate - 1], starts[candidate] - 1)
+                if match is not None:
+                    matches.append(match)
+
+        for match in matches:
+            line_num = bisect_right(starts, match.start())
+            if line_num == last_line:
+                continue
+            last_line = line_num
+
+            if match.lastgroup == 'mdef':
+                if not has_validation:
+                    self.issues.append(MethodologyIssue(
+                        severity='critical',
+                        category='missing_validation',
+                        description='Measurement method found but no validation against ground truth',
+                        location=f'{filepath}:{line_num}',
+                        recommendation='Implement validation against independent ground truth before using measure'
+                    ))
+                continue
+
+            line = content[starts[line_num-1]:starts[line_num] - 1]
+
+            # Get the method body (simplified - just look at nearby lines),
+            # sliced straight from content
+            method_body = content[starts[line_num]:starts[min(line_num + 20, n_lines)] - 1]
+
             # Check for circular patterns
-            if re.search(r'self\.(detect|measure|score)', method_body):
+            if _RE_CIRCULAR_CALL.search(method_body):
                 self.issues.append(MethodologyIssue(
                     severity='critical',
                     category='circular_logic',
@@ -121,9 +419,9 @@ class MethodologyAuditor:
                     location=f'{filepath}:{line_num}',
                     recommendation='Validate against independent ground truth, not self-generated data'
                 ))
-            
+
             # Check for pattern-based validation
-            if re.search(r'pattern', method_body.lower()) and re.search(r'pattern', line.lower()):
+            if _RE_PATTERN_WORD.search(method_body) and _RE_PATTERN_WORD.search(line):
                 self.issues.append(MethodologyIssue(
                     severity='critical',
                     category='circular_logic',
@@ -131,43 +429,29 @@ class MethodologyAuditor:
                     location=f'{filepath}:{line_num}',
                     recommendation='Validate against expert annotations, not pattern presence'
                 ))
-    
-    def _check_missing_validation(self, content: str, filepath: str):
-        """Check for measurement methods without validation"""
-        lines = content.split('\n')
-        
-        # Find measurement methods
-        measurement_methods = []
-        for i, line in enumerate(lines, 1):
-            for pattern in self.missing_validation_patterns:
-                if re.search(pattern, line):
-                    measurement_methods.append((i, line))
-        
-        # Check if there's any validation
-        has_validation = any(
-            re.search(r'(validate|validation|ground.truth)', content.lower())
-        )
-        
-        if measurement_methods and not has_validation:
-            for line_num, line in measurement_methods:
-                self.issues.append(MethodologyIssue(
-                    severity='critical',
-                    category='missing_validation',
-                    description='Measurement method found but no validation against ground truth',
-                    location=f'{filepath}:{line_num}',
-                    recommendation='Implement validation against independent ground truth before using measure'
-                ))
-    
-    def _check_statistical_issues(self, content: str, filepath: str):
-        """Check for statistical red flags"""
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            # Check for p-values without effect sizes
-            if re.search(r'p\s*[<>=]', line.lower()):
+
+    def _check_statistics_and_reproducibility(self, content: bytes, starts: List[int],
+                                              filepath: str, tags: Set[str]):
+        """Check for statistical red flags and reproducibility issues.
+
+        Runs the combined pattern once over the whole file and maps match
+        offsets back to line numbers via the shared line-offset table.
+        Presence of random/seed keywords comes from the shared keyword scan.
+        """
+        n_lines = len(starts) - 1
+
+        # Report at most one issue per (check, line), as the per-line scan did
+        last_pval_line = last_sig_line = last_hyper_line = 0
+
+        for group, offset in _scan_matches(content):
+            i = bisect_right(starts, offset)
+            line = content[starts[i-1]:starts[i]-1]
+
+            if group == 'pval' and i != last_pval_line:
+                last_pval_line = i
                 # Look for effect size in nearby lines
-                context = '\n'.join(lines[max(0, i-5):min(len(lines), i+5)])
-                if not re.search(r'(cohen|effect.size|confidence.interval)', context.lower()):
+                context = content[starts[max(0, i-5)]:starts[min(n_lines, i+5)] - 1]
+                if not _RE_EFFECT_SIZE.search(context):
                     self.issues.append(MethodologyIssue(
                         severity='major',
                         category='statistical_issue',
@@ -175,46 +459,22 @@ class MethodologyAuditor:
                         location=f'{filepath}:{i}',
                         recommendation='Always report effect sizes with confidence intervals alongside p-values'
                     ))
-            
-            # Check for significance claims
-            if re.search(r'significant', line.lower()) and not re.search(r'#', line):
-                self.issues.append(MethodologyIssue(
-                    severity='major',
-                    category='statistical_issue',
-                    description='Significance claim without statistical details',
-                    location=f'{filepath}:{i}',
-                    recommendation='Provide complete statistical details: test used, p-value, effect size, CI'
-                ))
-    
-    def _check_reproducibility(self, content: str, filepath: str):
-        """Check for reproducibility issues"""
-        lines = content.split('\n')
-        
-        # Check for random operations without seeds
-        has_random = False
-        has_seed = False
-        
-        for i, line in enumerate(lines, 1):
-            if re.search(r'(random|shuffle|sample|choice)', line.lower()):
-                has_random = True
-            if re.search(r'(seed|random_state)', line.lower()):
-                has_seed = True
-        
-        if has_random and not has_seed:
-            self.issues.append(MethodologyIssue(
-                severity='major',
-                category='reproducibility',
-                description='Random operations without seed specification',
-                location=f'{filepath}',
-                recommendation='Set random seed for reproducibility: np.random.seed(42) or random_state=42'
-            ))
-        
-        # Check for hardcoded values without documentation
-        for i, line in enumerate(lines, 1):
-            # Look for magic numbers in important contexts
-            if re.search(r'(threshold|alpha|beta|learning_rate)\s*=\s*[0-9.]+', line):
+
+            elif group == 'sig' and i != last_sig_line:
+                last_sig_line = i
+                if b'#' not in line:
+                    self.issues.append(MethodologyIssue(
+                        severity='major',
+                        category='statistical_issue',
+                        description='Significance claim without statistical details',
+                        location=f'{filepath}:{i}',
+                        recommendation='Provide complete statistical details: test used, p-value, effect size, CI'
+                    ))
+
+            elif group == 'hyper' and i != last_hyper_line:
+                last_hyper_line = i
                 # Check if there's a comment explaining it
-                if not re.search(r'#', line):
+                if b'#' not in line:
                     self.issues.append(MethodologyIssue(
                         severity='minor',
                         category='reproducibility',
@@ -222,112 +482,260 @@ class MethodologyAuditor:
                         location=f'{filepath}:{i}',
                         recommendation='Document why this value was chosen'
                     ))
-    
-    def _check_ast(self, tree: ast.AST, filepath: str):
-        """Check AST for deeper issues"""
-        
-        # Find all class definitions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                self._check_class(node, filepath)
-    
-    def _check_class(self, node: ast.ClassDef, filepath: str):
-        """Check a class for methodological issues"""
-        
-        # Find measurement and validation methods
-        measure_methods = []
-        validate_methods = []
-        
-        for item in node.body:
-            if isinstance(item, ast.FunctionDef):
-                name = item.name.lower()
-                if any(keyword in name for keyword in ['measure', 'detect', 'score', 'evaluate']):
-                    measure_methods.append(item)
-                if any(keyword in name for keyword in ['validate', 'verify', 'check']):
-                    validate_methods.append(item)
-        
-        # If there are measurement methods but no validation
-        if measure_methods and not validate_methods:
+
+        if 'random' in tags and 'seed' not in tags:
             self.issues.append(MethodologyIssue(
-                severity='critical',
-                category='missing_validation',
-                description=f'Class {node.name} has measurement methods but no validation',
-                location=f'{filepath}:{node.lineno}',
-                recommendation='Add validation method that checks against independent ground truth'
+                severity='major',
+                category='reproducibility',
+                description='Random operations without seed specification',
+                location=f'{filepath}',
+                recommendation='Set random seed for reproducibility: np.random.seed(42) or random_state=42'
             ))
-        
-        # Check if validation methods call measurement methods (circular)
-        for validate_method in validate_methods:
-            for measure_method in measure_methods:
-                # Check if validation calls measurement
-                for subnode in ast.walk(validate_method):
-                    if isinstance(subnode, ast.Call):
-                        if isinstance(subnode.func, ast.Attribute):
-                            if subnode.func.attr == measure_method.name:
-                                self.issues.append(MethodologyIssue(
-                                    severity='critical',
-                                    category='circular_logic',
-                                    description=f'Validation method {validate_method.name} calls measurement method {measure_method.name}',
-                                    location=f'{filepath}:{validate_method.lineno}',
-                                    recommendation='Validate against independent ground truth, not self-generated measurements'
-                                ))
     
+    def _check_tree(self, tree: ast.AST, filepath: str, has_validation: bool):
+        """Run the structural checks off the parsed AST.
+
+        A single NodeVisitor traversal covers everything the regex line
+        scans used to find (measurement defs without validation, validation
+        methods calling measurement methods) plus the class-level analysis.
+        """
+        _AuditVisitor(self, filepath, has_validation).visit(tree)
+
     def generate_report(self) -> str:
         """Generate a human-readable report"""
         if not self.issues:
             return "✓ No methodological issues found!"
         
-        # Group by severity
-        critical = [i for i in self.issues if i.severity == 'critical']
-        major = [i for i in self.issues if i.severity == 'major']
-        minor = [i for i in self.issues if i.severity == 'minor']
-        
-        report = "=" * 80 + "\n"
-        report += "METHODOLOGY AUDIT REPORT\n"
-        report += "=" * 80 + "\n\n"
-        
-        report += f"Total Issues: {len(self.issues)}\n"
-        report += f"  Critical: {len(critical)}\n"
-        report += f"  Major: {len(major)}\n"
-        report += f"  Minor: {len(minor)}\n\n"
-        
-        if critical:
-            report += "CRITICAL ISSUES (Must Fix Before Publication)\n"
-            report += "-" * 80 + "\n"
-            for issue in critical:
-                report += str(issue) + "\n\n"
-        
-        if major:
-            report += "MAJOR ISSUES (Should Fix)\n"
-            report += "-" * 80 + "\n"
-            for issue in major:
-                report += str(issue) + "\n\n"
-        
-        if minor:
-            report += "MINOR ISSUES (Nice to Fix)\n"
-            report += "-" * 80 + "\n"
-            for issue in minor:
-                report += str(issue) + "\n\n"
-        
-        report += "=" * 80 + "\n"
-        report += "RECOMMENDATIONS\n"
-        report += "=" * 80 + "\n\n"
-        
+        # Group by severity in a single pass over the issue list
+        buckets = {'critical': [], 'major': [], 'minor': []}
+        for issue in self.issues:
+            buckets[issue.severity].append(issue)
+        critical = buckets['critical']
+        major = buckets['major']
+        minor = buckets['minor']
+        
+        # Accumulate fragments and join once: repeated str += is O(N^2)
+        # when thousands of issues each expand to ~200 chars
+        buf = []
+        buf.append("=" * 80 + "\n")
+        buf.append("METHODOLOGY AUDIT REPORT\n")
+        buf.append("=" * 80 + "\n\n")
+
+        buf.append(f"Total Issues: {len(self.issues)}\n")
+        buf.append(f"  Critical: {len(critical)}\n")
+        buf.append(f"  Major: {len(major)}\n")
+        buf.append(f"  Minor: {len(minor)}\n\n")
+
+        sections = [
+            ("CRITICAL ISSUES (Must Fix Before Publication)", critical),
+            ("MAJOR ISSUES (Should Fix)", major),
+            ("MINOR ISSUES (Nice to Fix)", minor),
+        ]
+        for heading, issues in sections:
+            if issues:
+                buf.append(heading + "\n")
+                buf.append("-" * 80 + "\n")
+                for issue in issues:
+                    buf.append(str(issue))
+                    buf.append("\n\n")
+
+        buf.append("=" * 80 + "\n")
+        buf.append("RECOMMENDATIONS\n")
+        buf.append("=" * 80 + "\n\n")
+
         if critical:
-            report += "1. Address all CRITICAL issues before proceeding\n"
-            report += "   - Circular logic undermines all findings\n"
-            report += "   - Missing validation means measures are unvalidated\n\n"
-        
+            buf.append("1. Address all CRITICAL issues before proceeding\n")
+            buf.append("   - Circular logic undermines all findings\n")
+            buf.append("   - Missing validation means measures are unvalidated\n\n")
+
         if major:
-            report += "2. Fix MAJOR issues to strengthen claims\n"
-            report += "   - Statistical issues weaken credibility\n"
-            report += "   - Reproducibility issues prevent verification\n\n"
-        
+            buf.append("2. Fix MAJOR issues to strengthen claims\n")
+            buf.append("   - Statistical issues weaken credibility\n")
+            buf.append("   - Reproducibility issues prevent verification\n\n")
+
         if minor:
-            report += "3. Consider fixing MINOR issues for completeness\n"
-            report += "   - Improves documentation and clarity\n\n"
-        
-        return report
+            buf.append("3. Consider fixing MINOR issues for completeness\n")
+            buf.append("   - Improves documentation and clarity\n\n")
+
+        return "".join(buf)
+
+
+class _AuditVisitor(ast.NodeVisitor):
+    """Single-pass AST visitor behind MethodologyAuditor._check_tree.
+
+    Visits every node exactly once and keeps accumulator frames for the
+    enclosing functions and classes, instead of re-walking subtrees with
+    ast.walk for each check (ast.walk allocates a deque and yields every
+    node per call).
+    """
+
+    _MEASUREMENT_NAMES = ('measure', 'detect', 'score', 'evaluate')
+
+    def __init__(self, auditor: 'MethodologyAuditor', filepath: str, has_validation: bool):
+        self.auditor = auditor
+        self.filepath = filepath
+        self.has_validation = has_validation
+        self._func_frames = []
+        self._class_frames = []
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        frame = {
+            'node': node,
+            # ids of direct-body methods, so nested defs are not mistaken
+            # for methods of this class
+            'direct': {id(item) for item in node.body if isinstance(item, ast.FunctionDef)},
+            'measure_names': set(),
+            'validate_methods': [],
+        }
+        self._class_frames.append(frame)
+        self.generic_visit(node)
+        self._class_frames.pop()
+
+        # If there are measurement methods but no validation
+        if frame['measure_names'] and not frame['validate_methods']:
+            self.auditor.issues.append(MethodologyIssue(
+                severity='critical',
+                category='missing_validation',
+                description=f'Class {node.name} has measurement methods but no validation',
+                location=f'{self.filepath}:{node.lineno}',
+                recommendation='Add validation method that checks against independent ground truth'
+            ))
+
+        # Check if validation methods call measurement methods (circular)
+        for method, called_attrs in frame['validate_methods']:
+            for name in sorted(called_attrs & frame['measure_names']):
+                self.auditor.issues.append(MethodologyIssue(
+                    severity='critical',
+                    category='circular_logic',
+                    description=f'Validation method {method.name} calls measurement method {name}',
+                    location=f'{self.filepath}:{method.lineno}',
+                    recommendation='Validate against independent ground truth, not self-generated measurements'
+                ))
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # Cheapest test first: files with validation keywords can never
+        # produce this issue, regardless of how many defs they contain
+        if not self.has_validation and node.name in self._MEASUREMENT_NAMES:
+            self.auditor.issues.append(MethodologyIssue(
+                severity='critical',
+                category='missing_validation',
+                description='Measurement method found but no validation against ground truth',
+                location=f'{self.filepath}:{node.lineno}',
+                recommendation='Implement validation against independent ground truth before using measure'
+            ))
+
+        name = node.name.lower()
+        frame = {
+            'node': node,
+            'is_validation': any(k in name for k in ('validate', 'validation', 'verify')),
+            'calls_measurement': False,
+            'mentions_pattern': False,
+            'called_attrs': set(),
+        }
+        self._func_frames.append(frame)
+        self.generic_visit(node)
+        self._func_frames.pop()
+
+        if frame['is_validation']:
+            self._finish_validation_function(node, frame)
+
+        # Record direct methods on the enclosing class, if any
+        if self._class_frames:
+            class_frame = self._class_frames[-1]
+            if id(node) in class_frame['direct']:
+                if any(k in name for k in ('measure', 'detect', 'score', 'evaluate')):
+                    class_frame['measure_names'].add(node.name)
+                if any(k in name for k in ('validate', 'verify', 'check')):
+                    class_frame['validate_methods'].append((node, frame['called_attrs']))
+
+    def visit_Call(self, node: ast.Call):
+        if isinstance(node.func, ast.Attribute):
+            attr = node.func.attr
+            for frame in self._func_frames:
+                frame['called_attrs'].add(attr)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        is_self_measurement = (
+            isinstance(node.value, ast.Name) and node.value.id == 'self'
+            and node.attr.startswith(('detect', 'measure', 'score'))
+        )
+        mentions_pattern = 'pattern' in node.attr.lower()
+        if is_self_measurement or mentions_pattern:
+            for frame in self._func_frames:
+                if is_self_measurement:
+                    frame['calls_measurement'] = True
+                if mentions_pattern:
+                    frame['mentions_pattern'] = True
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        if 'pattern' in node.id.lower():
+            for frame in self._func_frames:
+                frame['mentions_pattern'] = True
+
+    def visit_Constant(self, node: ast.Constant):
+        # Compiled IGNORECASE search: string constants can be whole
+        # docstrings, not worth a lowercased copy each
+        if isinstance(node.value, str) and _RE_PATTERN_WORD_STR.search(node.value):
+            for frame in self._func_frames:
+                frame['mentions_pattern'] = True
+
+    def _finish_validation_function(self, node: ast.FunctionDef, frame: dict):
+        """Emit circular-logic issues for a completed validation function"""
+        if frame['calls_measurement']:
+            self.auditor.issues.append(MethodologyIssue(
+                severity='critical',
+                category='circular_logic',
+                description='Validation method calls measurement method from same class',
+                location=f'{self.filepath}:{node.lineno}',
+                recommendation='Validate against independent ground truth, not self-generated data'
+            ))
+
+        # Pattern matching validating pattern matching
+        signature_mentions_pattern = (
+            'pattern' in node.name.lower()
+            or any('pattern' in arg.arg.lower() for arg in node.args.args)
+        )
+        if signature_mentions_pattern and frame['mentions_pattern']:
+            self.auditor.issues.append(MethodologyIssue(
+                severity='critical',
+                category='circular_logic',
+                description='Pattern matching appears to validate pattern matching',
+                location=f'{self.filepath}:{node.lineno}',
+                recommendation='Validate against expert annotations, not pattern presence'
+            ))
+
+
+@lru_cache(maxsize=4096)
+def _audit_file_stat_cached(filepath: str, mtime_ns: int, size: int) -> Tuple[MethodologyIssue, ...]:
+    # The stat values are only part of the cache key; an unchanged
+    # (path, mtime, size) means the previous result can be replayed
+    return tuple(MethodologyAuditor().audit_file(filepath))
+
+
+def audit_file_cached(filepath: str) -> List[MethodologyIssue]:
+    """Audit a file with an in-process cache keyed by (path, mtime, size).
+
+    Repeated runs in the same process (watch mode, test suites) skip
+    unchanged files without re-reading them. Complements the on-disk
+    content-hash cache, which persists across processes but has to read
+    and hash each file first.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return MethodologyAuditor().audit_file(filepath)
+    return list(_audit_file_stat_cached(filepath, st.st_mtime_ns, st.st_size))
+
+
+def _audit_one(filepath: str) -> Tuple[str, List[MethodologyIssue]]:
+    """Audit a single file in a worker process.
+
+    Module-level so it pickles cleanly; each worker builds its own
+    auditor rather than shipping auditor state across processes.
+    """
+    return filepath, audit_file_cached(filepath)
 
 
 def audit_project(project_path: str, output_file: str = None):
@@ -349,12 +757,14 @@ def audit_project(project_path: str, output_file: str = None):
             f.write(report)
         print(f"\nReport saved to {output_file}")
     
-    # Return summary
+    # Return summary from the tallies audit_directory already kept,
+    # instead of re-scanning the issue list per severity
+    counts = auditor.severity_counts
     return {
         'total_issues': len(auditor.issues),
-        'critical': len([i for i in auditor.issues if i.severity == 'critical']),
-        'major': len([i for i in auditor.issues if i.severity == 'major']),
-        'minor': len([i for i in auditor.issues if i.severity == 'minor']),
+        'critical': counts['critical'],
+        'major': counts['major'],
+        'minor': counts['minor'],
         'files_with_issues': len(results)
     }
 